@@ -17,18 +17,21 @@ LAYER_TO_FOLDER: dict[str, str] = {
 }
 
 
+_SUBDIRS = ("Interface", "Sources", "Testing", "Tests")
+
+
 def _write_file(path: Path, content: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
+    # Callers create the directory tree up front, so no per-file mkdir here.
     path.write_text(content.rstrip() + "\n", encoding="utf-8")
 
 
-def _render_project_swift(layer: str, module_name: str) -> str:
-    case_name = _swift_identifier(module_name)
-    return f"""@preconcurrency import ProjectDescription
+# Constant format templates rendered once via `str.format_map` with a shared
+# context: {name} is the module name, {case} its Swift case, {layer} the layer.
+_TPL_PROJECT = """@preconcurrency import ProjectDescription
 @preconcurrency import ProjectInfraPlugin
 @preconcurrency import ProjectDescriptionHelpers
 
-let module = ModuleID.{layer}(.{case_name})
+let module = ModuleID.{layer}(.{case})
 
 let project = ProjectFactory.makeFeature(
     module: module,
@@ -39,29 +42,23 @@ let project = ProjectFactory.makeFeature(
 )
 """
 
-
-def _render_interface_swift(module_name: str) -> str:
-    return f"""public protocol {module_name}Service {{
+_TPL_INTERFACE = """public protocol {name}Service {{
     func ping() -> String
 }}
 """
 
+_TPL_IMPL = """import {name}Interface
 
-def _render_impl_swift(module_name: str) -> str:
-    return f"""import {module_name}Interface
-
-public final class {module_name}ServiceImpl: {module_name}Service {{
+public final class {name}ServiceImpl: {name}Service {{
     public init() {{}}
 
     public func ping() -> String {{ "pong" }}
 }}
 """
 
+_TPL_TESTING = """import {name}Interface
 
-def _render_testing_swift(module_name: str) -> str:
-    return f"""import {module_name}Interface
-
-public final class Mock{module_name}Service: {module_name}Service {{
+public final class Mock{name}Service: {name}Service {{
     public var pingResult: String
 
     public init(pingResult: String = "mock") {{
@@ -72,14 +69,12 @@ public final class Mock{module_name}Service: {module_name}Service {{
 }}
 """
 
+_TPL_TESTS = """import XCTest
+import {name}
 
-def _render_tests_swift(module_name: str) -> str:
-    return f"""import XCTest
-import {module_name}
-
-final class {module_name}Tests: XCTestCase {{
+final class {name}Tests: XCTestCase {{
     func testPing() {{
-        XCTAssertEqual({module_name}ServiceImpl().ping(), "pong")
+        XCTAssertEqual({name}ServiceImpl().ping(), "pong")
     }}
 }}
 """
@@ -105,8 +100,10 @@ def main() -> int:
     layer = args.layer.strip().lower()
     module_name = args.name.strip()
 
-    # Validate module name by attempting to derive a Swift identifier (raises on invalid).
-    _swift_identifier(module_name)
+    # Validates the module name as a side effect (raises on invalid); the
+    # result is reused below so the identifier is only derived once.
+    case_name = _swift_identifier(module_name)
+    ctx = {"name": module_name, "case": case_name, "layer": layer}
 
     layer_folder = LAYER_TO_FOLDER[layer]
     module_dir = MODULES_ROOT / layer_folder / module_name
@@ -115,18 +112,18 @@ def main() -> int:
         print(f"Already exists: {module_dir.relative_to(REPO_ROOT)}", file=sys.stderr)
         return 1
 
-    # Create folder structure.
-    (module_dir / "Interface").mkdir(parents=True, exist_ok=False)
-    (module_dir / "Sources").mkdir(parents=True, exist_ok=False)
-    (module_dir / "Testing").mkdir(parents=True, exist_ok=False)
-    (module_dir / "Tests").mkdir(parents=True, exist_ok=False)
+    # Create folder structure: one mkdir per directory, no repeated
+    # `parents=True` walks once the module root exists.
+    module_dir.mkdir(parents=True, exist_ok=False)
+    for subdir in _SUBDIRS:
+        (module_dir / subdir).mkdir(exist_ok=False)
 
     # Seed initial sources so the targets can build.
-    _write_file(module_dir / "Project.swift", _render_project_swift(layer, module_name))
-    _write_file(module_dir / "Interface" / f"{module_name}Service.swift", _render_interface_swift(module_name))
-    _write_file(module_dir / "Sources" / f"{module_name}ServiceImpl.swift", _render_impl_swift(module_name))
-    _write_file(module_dir / "Testing" / f"Mock{module_name}Service.swift", _render_testing_swift(module_name))
-    _write_file(module_dir / "Tests" / f"{module_name}Tests.swift", _render_tests_swift(module_name))
+    _write_file(module_dir / "Project.swift", _TPL_PROJECT.format_map(ctx))
+    _write_file(module_dir / "Interface" / f"{module_name}Service.swift", _TPL_INTERFACE.format_map(ctx))
+    _write_file(module_dir / "Sources" / f"{module_name}ServiceImpl.swift", _TPL_IMPL.format_map(ctx))
+    _write_file(module_dir / "Testing" / f"Mock{module_name}Service.swift", _TPL_TESTING.format_map(ctx))
+    _write_file(module_dir / "Tests" / f"{module_name}Tests.swift", _TPL_TESTS.format_map(ctx))
 
     print(f"Created: {module_dir.relative_to(REPO_ROOT)}")
     return 0
@@ -3,16 +3,32 @@
 from __future__ import annotations
 
 import argparse
-import re
+import collections
+import io
 import subprocess
 import sys
-import tempfile
 import time
 from pathlib import Path
 
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 
+# Every interesting tuist line starts with one of these literal prefixes, so
+# the classifier is pure `str.startswith` dispatch plus slicing — no regex.
+_WORKSPACE_PREFIX = "Generating workspace "
+_PROJECT_PREFIX = "Generating project "
+_TIME_PREFIX = "Total time taken:"
+_CACHE_PREFIX = "Using cache binaries for the following targets:"
+_GRAPH_PREFIX = "Loading and constructing the graph"
+
+_PREFIXES = (
+    _WORKSPACE_PREFIX,
+    _PROJECT_PREFIX,
+    _TIME_PREFIX,
+    _CACHE_PREFIX,
+    _GRAPH_PREFIX,
+)
+
 
 def _format_duration(seconds: float) -> str:
     if seconds < 1:
@@ -48,112 +64,121 @@ def main() -> int:
     project_names: list[str] = []
     cached_targets: list[str] = []
 
-    printed: set[str] = set()
+    printed_graph = printed_cache = printed_projects = False
     collecting_cached = False
 
-    with tempfile.NamedTemporaryFile(
-        mode="w",
-        encoding="utf-8",
-        delete=False,
-        prefix="tuist-generate.",
-        suffix=".log",
-    ) as log_file:
-        log_path = Path(log_file.name)
-
-        if not args.verbose:
-            _safe_print("🔃 tuist generate: start")
-
-        proc = subprocess.Popen(
-            cmd,
-            cwd=str(REPO_ROOT),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-        )
-
-        assert proc.stdout is not None
-        for line in proc.stdout:
-            log_file.write(line)
-
-            if args.verbose:
-                try:
-                    sys.stdout.write(line)
-                    sys.stdout.flush()
-                except BrokenPipeError:
-                    proc.stdout.close()
-                    proc.terminate()
-                    return 0
-
-            stripped = line.strip()
-            if not stripped:
+    # The log is only ever replayed on failure, so keep it in memory (bounded)
+    # instead of paying a temp-file write per line on the success path.
+    log_buffer: collections.deque[str] = collections.deque(maxlen=100_000)
+
+    if not args.verbose:
+        _safe_print("🔃 tuist generate: start")
+
+    # Block-buffered binary pipe: reads come in large chunks instead of a
+    # syscall per line; the TextIOWrapper amortizes decoding over chunks.
+    proc = subprocess.Popen(
+        cmd,
+        cwd=str(REPO_ROOT),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=-1,
+    )
+
+    assert proc.stdout is not None
+    stdout = io.TextIOWrapper(proc.stdout, encoding="utf-8", errors="replace", newline="")
+
+    if args.verbose:
+        # Pure passthrough: no stripping or classification, just echo each
+        # line; only the total-time line is picked up for the summary.
+        for line in stdout:
+            log_buffer.append(line)
+            try:
+                sys.stdout.write(line)
+                sys.stdout.flush()
+            except BrokenPipeError:
+                stdout.close()
+                proc.terminate()
+                return 0
+            if line.startswith(_TIME_PREFIX):
+                time_taken = line[len(_TIME_PREFIX):].strip()
+    else:
+        # The classifier works on the raw line: marker prefixes always start
+        # at column 0 in tuist output, `str.split` ignores surrounding
+        # whitespace on its own, and only the (rare) captured payloads need a
+        # strip — so no per-line `line.strip()` allocation.
+        for line in stdout:
+            log_buffer.append(line)
+
+            if line.isspace():
                 collecting_cached = False
                 continue
 
-            if "Loading and constructing the graph" in stripped:
-                if not args.verbose and "graph" not in printed:
-                    printed.add("graph")
+            # CPython dispatches the tuple form of `startswith` in C, so one
+            # call rules out uninteresting lines before any further work.
+            is_marker = line.startswith(_PREFIXES)
+
+            if collecting_cached:
+                if is_marker:
+                    collecting_cached = False
+                else:
+                    cached_targets.extend(
+                        target
+                        for target in (token.rstrip(",") for token in line.split())
+                        if target
+                    )
+                    continue
+
+            if not is_marker:
+                continue
+
+            if line.startswith(_GRAPH_PREFIX):
+                if not printed_graph:
+                    printed_graph = True
                     _safe_print("🔃 tuist generate: graph…")
                 continue
 
-            if stripped.startswith("Using cache binaries for the following targets:"):
-                if not args.verbose and "cache" not in printed:
-                    printed.add("cache")
+            if line.startswith(_CACHE_PREFIX):
+                if not printed_cache:
+                    printed_cache = True
                     _safe_print("🔃 tuist generate: cache…")
 
                 collecting_cached = True
-                suffix = stripped.split(":", 1)[1].strip()
+                suffix = line[len(_CACHE_PREFIX):].strip()
                 if suffix:
                     cached_targets.extend(
-                        [token.strip(",") for token in suffix.split() if token.strip(",")]
+                        target
+                        for target in (token.rstrip(",") for token in suffix.split())
+                        if target
                     )
                 continue
 
-            if collecting_cached:
-                if (
-                    stripped.startswith("Generating workspace ")
-                    or stripped.startswith("Generating project ")
-                    or stripped.startswith("Total time taken:")
-                ):
-                    collecting_cached = False
-                else:
-                    cached_targets.extend(
-                        [token.strip(",") for token in stripped.split() if token.strip(",")]
-                    )
-                    continue
-
-            workspace_match = re.match(r"^Generating workspace (.+)$", stripped)
-            if workspace_match:
-                workspace = workspace_match.group(1).strip()
-                if not args.verbose:
-                    _safe_print(f"🔃 tuist generate: workspace {workspace}")
+            if line.startswith(_WORKSPACE_PREFIX):
+                workspace = line[len(_WORKSPACE_PREFIX):].strip()
+                _safe_print(f"🔃 tuist generate: workspace {workspace}")
                 continue
 
-            project_match = re.match(r"^Generating project (.+)$", stripped)
-            if project_match:
-                project_names.append(project_match.group(1).strip())
-                if not args.verbose and "projects" not in printed:
-                    printed.add("projects")
+            if line.startswith(_PROJECT_PREFIX):
+                project_names.append(line[len(_PROJECT_PREFIX):].strip())
+                if not printed_projects:
+                    printed_projects = True
                     _safe_print("🔃 tuist generate: projects…")
                 continue
 
-            time_match = re.match(r"^Total time taken:\s*(.+)$", stripped)
-            if time_match:
-                time_taken = time_match.group(1).strip()
+            if line.startswith(_TIME_PREFIX):
+                time_taken = line[len(_TIME_PREFIX):].strip()
                 continue
 
-        exit_code = proc.wait()
+    exit_code = proc.wait()
 
     elapsed = time.perf_counter() - start
 
     if exit_code != 0:
         _safe_print(f"🔃 tuist generate: failed (exit {exit_code})")
         try:
-            sys.stdout.write(log_path.read_text(encoding="utf-8"))
+            sys.stdout.writelines(log_buffer)
+            sys.stdout.flush()
         except BrokenPipeError:
             return 0
-        finally:
-            log_path.unlink(missing_ok=True)
         return exit_code
 
     duration_str = time_taken or _format_duration(elapsed)
@@ -167,7 +192,6 @@ def main() -> int:
     workspace_str = f" → {workspace}" if workspace else ""
 
     _safe_print(f"🔃 tuist generate: done ({duration_str}){extras_str}{workspace_str}")
-    log_path.unlink(missing_ok=True)
     return 0
 
 